@@ -18,9 +18,32 @@ class Settings(BaseSettings):
         "https://www.theverge.com/rss/index.xml"
     ]
     
+    # Fetch Settings
+    FETCH_PER_HOST_LIMIT: int = 2  # concurrent article requests per host
+    FETCH_PER_HOST_INTERVAL: float = 1.0  # minimum seconds between request starts to the same host
+    FETCH_WORKERS: int = 16  # threads for article parsing and summarization
+    
+    # Article Storage Settings
+    ARTICLES_DB_PATH: str = "data/articles.db"
+    ARTICLES_BATCH_SIZE: int = 200  # articles per load, processing batch and transaction; keep below SQLite's 999-parameter limit
+    
+    # Article Cache Settings
+    ARTICLE_CACHE_TTL: int = 600  # seconds before endpoints re-fetch the feeds
+    
+    # Groq Settings
+    GROQ_TOKENS_PER_MINUTE: int = 6000  # token budget shared by all Groq requests
+    
+    # Embedding Settings
+    EMBEDDING_CACHE_DIR: str = "data/embedding_cache"
+    
     # Vector DB Settings
     VECTOR_DB_TYPE: str = "faiss"  # can be "pinecone", "weaviate", or "faiss"
     VECTOR_DIMENSION: int = 1024  # Cohere embedding dimension
+    VECTOR_INDEX_PATH: str = "data/vector_index/articles.faiss"
+    VECTOR_HNSW_THRESHOLD: int = 10000  # switch from brute-force to HNSW search above this many vectors
+    VECTOR_HNSW_M: int = 32  # graph neighbors per node
+    VECTOR_HNSW_EF_CONSTRUCTION: int = 40  # candidate list size while building the graph
+    VECTOR_HNSW_EF_SEARCH: int = 32  # candidate list size per query, trading speed for recall
     
     class Config:
         env_file = ".env"
@@ -1,31 +1,87 @@
 import cohere
-from typing import List, Dict
+import hashlib
+import os
+import tempfile
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 from config import settings
 
 class EmbeddingGenerator:
     def __init__(self):
         self.co = cohere.Client(api_key=settings.COHERE_API_KEY)
-    
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a list of texts using Cohere's API"""
+        self.model = 'embed-english-v3.0'
+        self.batch_size = 96  # Maximum number of texts Cohere accepts per embed call
+        self.cache_dir = settings.EMBEDDING_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _cache_path(self, text: str) -> str:
+        """Return the cache file path for a text, keyed by its SHA-256 digest"""
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{self.cache_dir}/{key}.npy"
+
+    def _load_cached(self, text: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for a text, or None if it isn't cached or can't be read"""
+        path = self._cache_path(text)
+        if not os.path.exists(path):
+            return None
         try:
-            response = self.co.embed(
-                texts=texts,
-                model='embed-english-v3.0',
-                input_type='search_document'
-            )
-            return response.embeddings
+            return np.load(path)
+        except Exception as e:
+            print(f"Ignoring unreadable embedding cache file {path}: {str(e)}")
+            return None
+
+    def _save_cached(self, text: str, embedding: np.ndarray):
+        """Cache an embedding, writing to a temporary file first so a crash never leaves a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # Store as float16 to halve the cache size on disk
+                np.save(f, embedding.astype(np.float16))
+            os.replace(tmp_path, self._cache_path(text))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts using Cohere's API, reusing cached embeddings
+
+        Returns a contiguous float32 array of shape (len(texts), dimension)
+        """
+        embeddings = np.empty((len(texts), settings.VECTOR_DIMENSION), dtype=np.float32)
+        missing = []
+
+        # Look up cached embeddings first
+        for i, text in enumerate(texts):
+            cached = self._load_cached(text)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                missing.append(i)
+
+        # Only send cache misses to Cohere, one request per full batch
+        try:
+            for start in range(0, len(missing), self.batch_size):
+                batch = missing[start:start + self.batch_size]
+                response = self.co.embed(
+                    texts=[texts[i] for i in batch],
+                    model=self.model,
+                    input_type='search_document'
+                )
+                embeddings[batch] = np.asarray(response.embeddings, dtype=np.float32)
+                for i in batch:
+                    self._save_cached(texts[i], embeddings[i])
         except Exception as e:
             print(f"Error generating embeddings: {str(e)}")
             raise
-    
-    def get_article_embeddings(self, articles: List[Dict]) -> Dict[str, List[float]]:
-        """Generate embeddings for articles and return a dictionary mapping article IDs to embeddings"""
+
+        return embeddings
+
+    def get_article_embeddings(self, articles: List[Dict]) -> Tuple[List[str], np.ndarray]:
+        """Generate embeddings for articles and return the article IDs with their embeddings, row for row"""
         # Combine title and content for better semantic representation
         texts = [f"{article['title']} {article['content']}" for article in articles]
-        
+
         # Generate embeddings for all texts
         embeddings = self.generate_embeddings(texts)
-        
-        # Create a mapping of article IDs to their embeddings
-        return {articles[i]['id']: embeddings[i] for i in range(len(articles))}
\ No newline at end of file
+
+        return [article['id'] for article in articles], embeddings
\ No newline at end of file
@@ -1,46 +1,132 @@
-from groq import Groq
+import asyncio
+import time
+from groq import AsyncGroq, RateLimitError, APITimeoutError, InternalServerError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 from typing import List, Dict
 from config import settings
 import httpx
 
+# Prompts are built once; only the article data is substituted per request,
+# so the system messages stay byte-identical across calls
+_ANALYZE_SYSTEM_MESSAGE = {"role": "system", "content": "You are a news analyst providing structured analysis of articles."}
+_ANALYZE_PROMPT_TEMPLATE = """Analyze this news article and provide key insights:
+
+Title: {title}
+Content: {content}
+
+Please provide:
+1. A brief summary (2-3 sentences)
+2. Main topics/themes
+3. Key takeaways
+4. Sentiment (positive/negative/neutral)
+
+Format the response as JSON."""
+
+_CLUSTERS_SYSTEM_MESSAGE = {"role": "system", "content": "You are a news analyst specializing in topic clustering and summarization."}
+_CLUSTERS_PROMPT_TEMPLATE = """Given these news article titles:
+
+{titles}
+
+Group them into 3-5 main topic clusters. For each cluster:
+1. Provide a cluster name/theme
+2. List the relevant article titles
+3. Write a brief overview of the cluster theme
+
+Format the response as JSON."""
+
+_TRENDS_SYSTEM_MESSAGE = {"role": "system", "content": "You are a news analyst identifying trends and their significance."}
+_TRENDS_PROMPT_TEMPLATE = """Analyze these news articles and identify:
+1. Top 3 trending topics
+2. Their significance and potential impact
+3. Related developments to watch
+
+Articles:
+{titles}"""
+
 class LLMAnalyzer:
     def __init__(self):
         # Create a custom httpx client with the desired configuration
-        http_client = httpx.Client(
+        http_client = httpx.AsyncClient(
             timeout=60.0,  # 60 seconds timeout
             follow_redirects=True
         )
         
-        self.client = Groq(
+        # Retries are handled by _create_completion, so every attempt goes through the token budget
+        self.client = AsyncGroq(
             api_key=settings.GROQ_API_KEY,
-            http_client=http_client
+            http_client=http_client,
+            max_retries=0
         )
         # Using a llama model from Groq
         self.model = "llama-3.3-70b-versatile"
-    
-    async def analyze_article(self, article: Dict) -> Dict:
-        """Analyze a single article and return key insights"""
-        prompt = f"""Analyze this news article and provide key insights:
+        # Bound concurrent requests to stay within Groq's rate limits; created on first use,
+        # so it belongs to the running event loop rather than the one current at import
+        self._semaphore = None
+        # Tokens used in the current one-minute window, to stay under the per-minute budget
+        self._token_budget = settings.GROQ_TOKENS_PER_MINUTE
+        self._tokens_used = 0
+        self._window_start = time.monotonic()
 
-Title: {article['title']}
-Content: {article['content']}
+    async def _reserve_tokens(self, tokens: int) -> float:
+        """Wait until the current minute's token budget can fit another request
 
-Please provide:
-1. A brief summary (2-3 sentences)
-2. Main topics/themes
-3. Key takeaways
-4. Sentiment (positive/negative/neutral)
+        Returns the start of the window the tokens were reserved in
+        """
+        while True:
+            now = time.monotonic()
+            if now - self._window_start >= 60:
+                self._window_start = now
+                self._tokens_used = 0
+            if self._tokens_used == 0 or self._tokens_used + tokens <= self._token_budget:
+                self._tokens_used += tokens
+                return self._window_start
+            await asyncio.sleep(60 - (now - self._window_start))
 
-Format the response as JSON."""
+    def _settle_tokens(self, window_start: float, reserved: int, used: int):
+        """Replace a reservation with the tokens a request actually used"""
+        if window_start == self._window_start:
+            self._tokens_used = max(0, self._tokens_used - reserved + used)
+        else:
+            # The reservation was dropped with its window; only the actual usage counts in this one
+            self._tokens_used += used
 
+    @retry(
+        wait=wait_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception_type((RateLimitError, APITimeoutError, InternalServerError, httpx.TimeoutException)),
+        reraise=True
+    )
+    async def _create_completion(self, messages: List[Dict], max_tokens: int):
+        """Send a chat completion request, retrying transient Groq failures with backoff"""
+        # The budget covers prompt and completion tokens; estimate the prompt at ~4 characters per token
+        reserved = max_tokens + sum(len(message['content']) for message in messages) // 4
+        window_start = await self._reserve_tokens(reserved)
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
+                messages=messages,
+                model=self.model,
+                temperature=0.3,
+                max_tokens=max_tokens
+            )
+        except Exception:
+            # Failed requests don't count against the budget
+            self._settle_tokens(window_start, reserved, 0)
+            raise
+        # Replace the reservation with the actual usage
+        if response.usage:
+            self._settle_tokens(window_start, reserved, response.usage.total_tokens)
+        return response
+    
+    async def analyze_article(self, article: Dict) -> Dict:
+        """Analyze a single article and return key insights"""
+        prompt = _ANALYZE_PROMPT_TEMPLATE.format_map(article)
+
+        try:
+            response = await self._create_completion(
                 messages=[
-                    {"role": "system", "content": "You are a news analyst providing structured analysis of articles."},
+                    _ANALYZE_SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
-                model=self.model,
-                temperature=0.3,
                 max_tokens=1000
             )
             
@@ -52,29 +138,29 @@ Format the response as JSON."""
             print(f"Error analyzing article: {str(e)}")
             raise
 
+    async def analyze_many(self, articles: List[Dict]) -> List[Dict]:
+        """Analyze several articles concurrently"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(10)
+
+        async def analyze_bounded(article: Dict) -> Dict:
+            async with self._semaphore:
+                return await self.analyze_article(article)
+
+        return await asyncio.gather(*[analyze_bounded(article) for article in articles])
+
     async def generate_topic_clusters(self, articles: List[Dict]) -> Dict:
         """Group articles into topic clusters and provide summaries"""
         titles = "\n".join([f"- {article['title']}" for article in articles])
         
-        prompt = f"""Given these news article titles:
-
-{titles}
-
-Group them into 3-5 main topic clusters. For each cluster:
-1. Provide a cluster name/theme
-2. List the relevant article titles
-3. Write a brief overview of the cluster theme
-
-Format the response as JSON."""
+        prompt = _CLUSTERS_PROMPT_TEMPLATE.format(titles=titles)
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self._create_completion(
                 messages=[
-                    {"role": "system", "content": "You are a news analyst specializing in topic clustering and summarization."},
+                    _CLUSTERS_SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
-                model=self.model,
-                temperature=0.3,
                 max_tokens=1500
             )
             
@@ -84,3 +170,24 @@ Format the response as JSON."""
         except Exception as e:
             print(f"Error generating topic clusters: {str(e)}")
             raise
+
+    async def analyze_trends(self, articles: List[Dict]) -> str:
+        """Identify trending topics and their significance across articles"""
+        # Using top 10 articles
+        titles = [article['title'] for article in articles[:10]]
+
+        prompt = _TRENDS_PROMPT_TEMPLATE.format(titles=titles)
+
+        try:
+            response = await self._create_completion(
+                messages=[
+                    _TRENDS_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=1000
+            )
+
+            return response.choices[0].message.content
+        except Exception as e:
+            print(f"Error generating trending analysis: {str(e)}")
+            raise
\ No newline at end of file
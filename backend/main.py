@@ -1,4 +1,8 @@
+import asyncio
+from typing import Dict, List, Optional
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query
+from config import settings
 from news_fetcher import NewsFetcher
 from embeddings import EmbeddingGenerator
 from vector_store import VectorStore
@@ -12,6 +16,26 @@ vector_store = VectorStore()
 llm_analyzer = LLMAnalyzer()
 recommender = Recommender(vector_store, embedding_generator)  # Create a Recommender instance
 
+# Fetched articles are reused across endpoints until the TTL expires
+articles_cache = TTLCache(maxsize=1, ttl=settings.ARTICLE_CACHE_TTL)
+articles_by_id: Dict[str, Dict] = {}
+# Created on first use, so it belongs to the server's event loop rather than the one current at import
+articles_cache_lock: Optional[asyncio.Lock] = None
+
+async def get_articles_cached(refresh: bool = False) -> List[Dict]:
+    """Return the fetched articles, only hitting the feeds when the cache is empty or stale"""
+    global articles_cache_lock
+    if articles_cache_lock is None:
+        articles_cache_lock = asyncio.Lock()
+    async with articles_cache_lock:
+        articles = articles_cache.get("articles")
+        if articles is None or refresh:
+            articles = await news_fetcher.fetch_articles()
+            articles_cache["articles"] = articles
+            articles_by_id.clear()
+            articles_by_id.update((article['id'], article) for article in articles)
+        return articles
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to DS Task AI News API"}
@@ -20,14 +44,14 @@ async def root():
 async def fetch_news():
     try:
         # Fetch articles
-        articles = news_fetcher.fetch_articles()
+        articles = await get_articles_cached(refresh=True)
         
         # Generate embeddings
-        article_embeddings = embedding_generator.get_article_embeddings(articles)
+        article_ids, embeddings = embedding_generator.get_article_embeddings(articles)
         
         # Store in vector database
         vector_store.clear()  # Clear existing entries
-        vector_store.add_articles(article_embeddings)
+        vector_store.add_articles(article_ids, embeddings)
         
         return {"status": "success", "articles": articles}
     except Exception as e:
@@ -38,7 +62,7 @@ async def fetch_news():
 async def recommend_news(article_id: str = Query(..., description="ID of the article to find similar articles for")):
     try:
         # Fetch all articles to have the full context
-        articles = news_fetcher.fetch_articles()
+        articles = await get_articles_cached()
         
         # Use the recommender to find similar articles
         similar_articles = recommender.get_similar_articles(article_id, articles)
@@ -52,10 +76,10 @@ async def analyze_article(article_id: str):
     """Get detailed AI analysis of a specific article"""
     try:
         # Fetch all articles
-        articles = news_fetcher.fetch_articles()
+        await get_articles_cached()
         
         # Find the target article
-        article = next((article for article in articles if article['id'] == article_id), None)
+        article = articles_by_id.get(article_id)
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
         
@@ -75,7 +99,7 @@ async def get_topic_clusters():
     """Get AI-generated topic clusters from current news articles"""
     try:
         # Fetch articles
-        articles = news_fetcher.fetch_articles()
+        articles = await get_articles_cached()
         
         # Generate topic clusters
         clusters = await llm_analyzer.generate_topic_clusters(articles)
@@ -92,31 +116,14 @@ async def get_trending_analysis():
     """Get analysis of trending topics and their significance"""
     try:
         # Fetch articles
-        articles = news_fetcher.fetch_articles()
-        
-        # Prepare prompt for trending analysis
-        prompt = f"""Analyze these news articles and identify:
-        1. Top 3 trending topics
-        2. Their significance and potential impact
-        3. Related developments to watch
-
-        Articles:
-        {[article['title'] for article in articles[:10]]}  # Using top 10 articles
-        """
+        articles = await get_articles_cached()
         
-        response = llm_analyzer.client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": "You are a news analyst identifying trends and their significance."},
-                {"role": "user", "content": prompt}
-            ],
-            model=llm_analyzer.model,
-            temperature=0.3,
-            max_tokens=1000
-        )
+        # Get LLM trending analysis
+        trending_analysis = await llm_analyzer.analyze_trends(articles)
         
         return {
             "status": "success",
-            "trending_analysis": response.choices[0].message.content
+            "trending_analysis": trending_analysis
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
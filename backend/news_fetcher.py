@@ -1,16 +1,29 @@
+import asyncio
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import feedparser
 from datetime import datetime
-from typing import List, Dict, Optional, Set
-import hashlib
-import json
+from typing import List, Dict, Optional, Set, Tuple
 import os
+import sqlite3
+import threading
+import orjson
+import xxhash
 from config import settings
 import nltk
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
+from nltk.tokenize.punkt import PunktTokenizer
 from bs4 import BeautifulSoup
-import requests
-import time
+import soupsieve
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # fall back to BeautifulSoup with lxml
+    LexborHTMLParser = None
+import httpx
+from tenacity import retry, retry_if_result, stop_after_attempt, wait_exponential
+import trafilatura
+import numpy as np
+from numba import njit
 from urllib.parse import urlparse
 import logging
 
@@ -21,112 +34,303 @@ logging.basicConfig(
 )
 logger = logging.getLogger('news_fetcher')
 
+# Page elements that never hold article text, and common article containers
+_UNWANTED_SELECTOR = 'script, style, nav, header, footer, iframe'
+_CONTENT_SELECTOR = 'article, .article-content, .post-content, .entry-content'
+
+# Gateway errors that are usually transient and worth retrying
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# NLTK data needed at runtime, as (package, resource path) pairs
+_NLTK_RESOURCES = (('punkt_tab', 'tokenizers/punkt_tab'),)
+_nltk_ready = False
+_nltk_lock = threading.Lock()
+
+def _ensure_nltk():
+    """Make sure the NLTK data is available, checking only once per process
+
+    Summaries run on worker threads, so the lock keeps concurrent first calls from downloading twice
+    """
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _nltk_lock:
+        if _nltk_ready:
+            return
+        for package, path in _NLTK_RESOURCES:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                nltk.download(package, quiet=True)
+        _nltk_ready = True
+
+@functools.lru_cache(maxsize=1)
+def _sentence_tokenizer() -> PunktTokenizer:
+    """Load the English Punkt sentence tokenizer once per process"""
+    _ensure_nltk()
+    return PunktTokenizer('english')
+
+@njit(cache=True)
+def _score_sentences(n_sentences: int, word_counts: np.ndarray) -> np.ndarray:
+    """Score sentences by position, favoring medium-length ones"""
+    scores = np.empty(n_sentences, dtype=np.float64)
+    for i in range(n_sentences):
+        # Favor earlier sentences
+        scores[i] = 1.0 / (i + 1)
+        # Favor medium-length sentences
+        if 10 <= word_counts[i] <= 30:
+            scores[i] += 0.5
+    return scores
+
 class NewsFetcher:
     def __init__(self):
         self.feed_urls = settings.RSS_FEEDS
         self.raw_data_dir = "data/raw_news"
         self.processed_data_dir = "data/processed_news"
+        self.db_path = settings.ARTICLES_DB_PATH
         self._ensure_directories()
+        self._init_db()
         
-        # Initialize NLTK components
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
+        # Shared HTTP client for feed and article requests; the transport pools connections
+        # and retries failed connection attempts
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=32)
+            ),
+            timeout=10,
+            follow_redirects=True,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            }
+        )
+        # Bounded pool for CPU-bound parsing and summarization, keeping the event loop free
+        self._executor = ThreadPoolExecutor(max_workers=settings.FETCH_WORKERS)
         
-        self.stop_words = set(stopwords.words('english'))
+        # Common article containers, compiled once and matched in a single pass over the page
+        self._content_selector = soupsieve.compile(_CONTENT_SELECTOR)
+        
+        # Limit concurrent article requests per host, so different sites are fetched in parallel
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(settings.FETCH_PER_HOST_LIMIT)
+        )
+        # Earliest event-loop time at which the next request to each host may start
+        self._host_next_request: Dict[str, float] = {}
 
     def _ensure_directories(self):
         """Ensure required data directories exist"""
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def _init_db(self):
+        """Open the article database, importing legacy JSON article files on first use"""
+        is_new = not os.path.exists(self.db_path)
+        self._db = sqlite3.connect(self.db_path, isolation_level=None)
+        # WAL lets readers proceed during writes, and NORMAL sync skips an fsync per commit
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS articles "
+            "(id TEXT PRIMARY KEY, processed INTEGER NOT NULL, date TEXT, payload BLOB NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_articles_processed_date ON articles (processed, date)")
+        # Conditional GET validators and the article IDs seen in each feed's last fetch
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS feeds "
+            "(url TEXT PRIMARY KEY, etag TEXT, modified TEXT, article_ids BLOB NOT NULL)"
+        )
+        if is_new:
+            self._import_json_articles()
+
+    def _import_json_articles(self):
+        """Import articles stored as one JSON file each by earlier versions
+
+        Earlier versions derived IDs with other hash functions, so imported articles are re-keyed
+        with the current one to match the IDs the same stories get when fetched again
+        """
+        articles = {}
+        # Processed files are read last so they replace their raw versions
         for directory in [self.raw_data_dir, self.processed_data_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                if filename.endswith('.json'):
+                    try:
+                        with open(os.path.join(directory, filename), 'rb') as f:
+                            article = orjson.loads(f.read())
+                        article['id'] = self.generate_article_id(article['title'], article.get('date', ''))
+                        articles[article['id']] = article
+                    except Exception as e:
+                        logger.error(f"Error importing article file {filename}: {str(e)}")
+        if articles:
+            self._save_articles(list(articles.values()))
+            logger.info(f"Imported {len(articles)} articles into {self.db_path}")
 
     def generate_article_id(self, title: str, date: str) -> str:
         """Generate a unique ID for an article based on title and date"""
         content = f"{title}{date}".encode('utf-8')
-        return hashlib.md5(content).hexdigest()
+        return xxhash.xxh3_128_hexdigest(content)
+
+    def _save_articles(self, articles: List[Dict]):
+        """Save articles in a single transaction, replacing earlier versions"""
+        rows = [
+            (article['id'], int(article.get('processed', False)), article.get('date', ''), orjson.dumps(article))
+            for article in articles
+        ]
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO articles (id, processed, date, payload) VALUES (?, ?, ?, ?)",
+                rows
+            )
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
 
-    def _save_raw_article(self, article: Dict):
-        """Save raw article data"""
-        filename = f"{self.raw_data_dir}/{article['id']}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(article, f, ensure_ascii=False, indent=2)
+    def _load_articles(self, article_ids: List[str]) -> List[Dict]:
+        """Load stored articles, in the order of the given IDs"""
+        articles = {}
+        # Query in batches to stay within SQLite's limit on bound parameters
+        batch_size = settings.ARTICLES_BATCH_SIZE
+        for start in range(0, len(article_ids), batch_size):
+            batch = article_ids[start:start + batch_size]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._db.execute(f"SELECT id, payload FROM articles WHERE id IN ({placeholders})", batch)
+            articles.update((article_id, orjson.loads(payload)) for article_id, payload in rows)
+        return [articles[article_id] for article_id in article_ids if article_id in articles]
 
-    def _save_processed_article(self, article: Dict):
-        """Save processed article data"""
-        filename = f"{self.processed_data_dir}/{article['id']}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(article, f, ensure_ascii=False, indent=2)
+    def _save_feed_state(self, feed_url: str, etag: Optional[str], modified: Optional[str], article_ids: List[str]):
+        """Remember a feed's validators and article IDs for the next conditional fetch"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO feeds (url, etag, modified, article_ids) VALUES (?, ?, ?, ?)",
+            (feed_url, etag, modified, orjson.dumps(article_ids))
+        )
 
-    def _fetch_full_content(self, url: str) -> Optional[str]:
+    def _get_feed_article_ids(self, feed_url: str) -> List[str]:
+        """Get the article IDs seen in a feed's last fetch"""
+        row = self._db.execute("SELECT article_ids FROM feeds WHERE url = ?", (feed_url,)).fetchone()
+        return orjson.loads(row[0]) if row else []
+
+    def _extract_content(self, html: str) -> Optional[str]:
+        """Extract the main article text from an HTML page"""
+        content = trafilatura.extract(html, include_comments=False)
+        if content:
+            return content
+        
+        # Fall back to common article structures
+        if LexborHTMLParser is not None:
+            return self._extract_with_selectolax(html)
+        return self._extract_with_soup(html)
+
+    def _extract_with_selectolax(self, html: str) -> Optional[str]:
+        """Extract article text from common article containers using selectolax's C parser"""
+        tree = LexborHTMLParser(html)
+        
+        # Remove unwanted elements in a single traversal
+        for node in tree.css(_UNWANTED_SELECTOR):
+            node.decompose()
+        
+        # Find main content (customize based on common article structures)
+        content = tree.css_first(_CONTENT_SELECTOR)
+        if content:
+            return content.text(separator=' ', strip=True)
+        return None
+
+    def _extract_with_soup(self, html: str) -> Optional[str]:
+        """Extract article text from common article containers using BeautifulSoup with lxml"""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Remove unwanted elements
+        for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 'iframe']):
+            element.decompose()
+        
+        # Find main content (customize based on common article structures)
+        content = self._content_selector.select_one(soup)
+        if content:
+            return content.get_text(separator=' ', strip=True)
+        return None
+
+    async def _run_in_executor(self, func, *args):
+        """Run a blocking function on the fetcher's thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _wait_for_host(self, host: str):
+        """Space out requests to the same host, so politeness doesn't slow down other hosts"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve the next free slot for this host before sleeping, so concurrent callers queue up
+        slot = max(now, self._host_next_request.get(host, now))
+        self._host_next_request[host] = slot + settings.FETCH_PER_HOST_INTERVAL
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    @retry(
+        wait=wait_exponential(multiplier=0.3, max=5),
+        stop=stop_after_attempt(3),
+        retry=retry_if_result(lambda response: response.status_code in _RETRY_STATUS_CODES),
+        retry_error_callback=lambda state: state.outcome.result()
+    )
+    async def _get(self, url: str, host: Optional[str] = None, **kwargs) -> httpx.Response:
+        """GET a URL, retrying gateway errors with backoff and returning the last response
+
+        If host is given, every attempt waits for its own per-host slot, so retries stay spaced out too
+        """
+        if host:
+            await self._wait_for_host(host)
+        return await self._client.get(url, **kwargs)
+
+    async def _fetch_full_content(self, url: str) -> Optional[str]:
         """Attempt to fetch full article content from URL"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
+            host = urlparse(url).netloc
+            async with self._host_semaphores[host]:
+                response = await self._get(url, host=host)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 'iframe']):
-                element.decompose()
-            
-            # Find main content (customize based on common article structures)
-            content = None
-            for selector in ['article', '.article-content', '.post-content', '.entry-content']:
-                content = soup.select_one(selector)
-                if content:
-                    break
-            
-            if content:
-                return content.get_text(separator=' ', strip=True)
-            return None
+            # Parsing is CPU-bound, so keep it off the event loop
+            return await self._run_in_executor(self._extract_content, response.text)
             
         except Exception as e:
             logger.warning(f"Error fetching full content from {url}: {str(e)}")
             return None
 
-    def _process_article(self, article: Dict) -> Dict:
+    async def _process_article(self, article: Dict) -> Dict:
         """Process article content and extract additional features"""
         try:
-            processed_article = article.copy()
+            # The article is updated in place; callers don't keep the unprocessed version
+            content = article.get('content') or ''
+            link = article.get('link')
             
             # Attempt to fetch full content if summary is too short
-            if len(article.get('content', '')) < 500 and article.get('link'):
-                full_content = self._fetch_full_content(article['link'])
+            if len(content) < 500 and link:
+                full_content = await self._fetch_full_content(link)
                 if full_content:
-                    processed_article['full_content'] = full_content
+                    article['full_content'] = full_content
             
             # Extract domain from source URL
-            if 'source' in article and article['source']:
-                domain = urlparse(article['source']).netloc
-                processed_article['domain'] = domain
-            else:
-                processed_article['domain'] = "unknown"
+            source = article.get('source')
+            article['domain'] = urlparse(source).netloc if source else "unknown"
             
             # Generate summary if full content is available
-            if 'full_content' in processed_article:
-                processed_article['summary'] = self._generate_summary(processed_article['full_content'])
+            if 'full_content' in article:
+                content = article['full_content']
+                article['summary'] = await self._run_in_executor(self._generate_summary, content)
             else:
-                processed_article['summary'] = processed_article.get('content', '')
+                article['summary'] = content
             
-            # Calculate reading time (assuming 200 words per minute)
-            content = processed_article.get('full_content', processed_article.get('content', ''))
-            word_count = len(content.split())
-            processed_article['reading_time_minutes'] = max(1, round(word_count / 200))
+            # Calculate reading time (assuming 200 words per minute), counting word separators
+            # instead of splitting the text into a list of words
+            word_count = content.count(' ') + content.count('\n') + (1 if content else 0)
+            article['reading_time_minutes'] = max(1, round(word_count / 200))
             
             # Mark as processed
-            processed_article['processed'] = True
-            processed_article['processed_timestamp'] = datetime.utcnow().isoformat()
+            article['processed'] = True
+            article['processed_timestamp'] = datetime.utcnow().isoformat()
             
-            return processed_article
+            return article
         except Exception as e:
             logger.error(f"Error processing article {article.get('id', 'unknown')}: {str(e)}")
             # Even if processing fails, mark it as processed to prevent retry loops
@@ -135,33 +339,29 @@ class NewsFetcher:
             article['processing_error'] = str(e)
             return article
 
-    def _generate_summary(self, text: str, max_sentences: int = 3) -> str:
-        """Generate a brief summary of the article content"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_summary(text: str, max_sentences: int = 3) -> str:
+        """Generate a brief summary of the article content, memoized for repeated texts"""
         try:
             # Simple extractive summarization
-            sentences = sent_tokenize(text)
+            sentences = _sentence_tokenizer().tokenize(text)
             
             if len(sentences) <= max_sentences:
                 return text
             
             # Score sentences based on position and length
-            scored_sentences = []
-            for i, sentence in enumerate(sentences):
-                score = 0
-                # Favor earlier sentences
-                score += 1.0 / (i + 1)
-                # Favor medium-length sentences
-                words = len(sentence.split())
-                if 10 <= words <= 30:
-                    score += 0.5
-                
-                scored_sentences.append((score, sentence))
+            word_counts = np.fromiter(
+                (len(sentence.split()) for sentence in sentences),
+                dtype=np.int32,
+                count=len(sentences)
+            )
+            scores = _score_sentences(len(sentences), word_counts)
             
             # Select top sentences while maintaining order
-            top_sentences = sorted(scored_sentences, key=lambda x: x[0], reverse=True)[:max_sentences]
-            summary_sentences = [s[1] for s in sorted(top_sentences, key=lambda x: sentences.index(x[1]))]
+            top_indices = np.sort(np.argpartition(-scores, max_sentences)[:max_sentences])
             
-            return ' '.join(summary_sentences)
+            return ' '.join(sentences[i] for i in top_indices)
         except Exception as e:
             logger.warning(f"Error generating summary: {str(e)}")
             # Return a portion of the text as a fallback
@@ -169,174 +369,214 @@ class NewsFetcher:
                 return text[:500] + "..."
             return text
 
-    def fetch_articles(self) -> List[Dict]:
-        """Fetch articles from all configured RSS feeds"""
-        all_articles = []
+    async def _fetch_feed(self, feed_url: str) -> Tuple[Optional[feedparser.FeedParserDict], Optional[str], Optional[str]]:
+        """
+        Download and parse a single RSS feed with a conditional GET
+        Returns (feed, etag, modified), where feed is None if it has not changed since the last fetch
+        """
+        logger.info(f"Fetching from {feed_url}")
+        headers = {}
+        row = self._db.execute("SELECT etag, modified FROM feeds WHERE url = ?", (feed_url,)).fetchone()
+        if row:
+            etag, modified = row
+            if etag:
+                headers['If-None-Match'] = etag
+            if modified:
+                headers['If-Modified-Since'] = modified
+        
+        response = await self._get(feed_url, headers=headers)
+        if response.status_code == 304:
+            logger.info(f"{feed_url} has not changed since the last fetch")
+            return None, None, None
+        response.raise_for_status()
+        
+        return feedparser.parse(response.text), response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    def _build_article(self, entry, feed_url: str) -> Dict:
+        """Build the raw article for a single feed entry"""
+        article_id = self.generate_article_id(entry.title, entry.get('published', ''))
+        
+        return {
+            "id": article_id,
+            "title": entry.title,
+            "content": entry.get('summary', ''),
+            "date": entry.get('published', ''),
+            "link": entry.get('link', ''),
+            "source": feed_url,
+            "categories": [tag.term for tag in entry.get('tags', [])],
+            "fetch_timestamp": datetime.utcnow().isoformat(),
+            "processed": False
+        }
+
+    async def _fetch_one_feed(self, feed_url: str, seen_ids: Set[str]) -> List[str]:
+        """Fetch a single feed and process its new articles, returning the IDs of all articles it lists
+
+        seen_ids holds the IDs already stored or claimed by another feed in this run, and is updated in place
+        """
+        feed, etag, modified = await self._fetch_feed(feed_url)
+        if feed is None:
+            # Unchanged feed: reuse the articles from its last fetch
+            return self._get_feed_article_ids(feed_url)
         
-        for feed_url in self.feed_urls:
+        article_ids = []
+        raw_articles = []
+        for entry in feed.entries:
             try:
-                logger.info(f"Fetching from {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                for entry in feed.entries:
-                    try:
-                        article_id = self.generate_article_id(entry.title, entry.get('published', ''))
-                        
-                        article = {
-                            "id": article_id,
-                            "title": entry.title,
-                            "content": entry.get('summary', ''),
-                            "date": entry.get('published', ''),
-                            "link": entry.get('link', ''),
-                            "source": feed_url,
-                            "categories": [tag.term for tag in entry.get('tags', [])],
-                            "fetch_timestamp": datetime.utcnow().isoformat(),
-                            "processed": False
-                        }
-                        
-                        # Save raw article data
-                        self._save_raw_article(article)
-                        
-                        # Process article
-                        processed_article = self._process_article(article)
-                        self._save_processed_article(processed_article)
-                        
-                        all_articles.append(processed_article)
-                        
-                        # Be nice to servers
-                        time.sleep(1)
-                    except Exception as e:
-                        logger.error(f"Error processing entry {entry.get('title', 'unknown')}: {str(e)}")
-                        continue
-                    
+                article = self._build_article(entry, feed_url)
             except Exception as e:
-                logger.error(f"Error fetching from {feed_url}: {str(e)}")
+                logger.error(f"Error processing entry {entry.get('title', 'unknown')}: {str(e)}")
+                continue
+            article_ids.append(article['id'])
+            # Only new articles need their full content fetched and processed
+            if article['id'] not in seen_ids:
+                seen_ids.add(article['id'])
+                raw_articles.append(article)
+        
+        # Save raw article data
+        self._save_articles(raw_articles)
+        
+        # Process all new articles concurrently; article requests are throttled per host
+        results = await asyncio.gather(
+            *(self._process_article(article) for article in raw_articles),
+            return_exceptions=True
+        )
+        
+        processed_articles = []
+        for article, result in zip(raw_articles, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing entry {article['title']}: {str(result)}")
+                continue
+            processed_articles.append(result)
+        
+        # Save processed article data
+        self._save_articles(processed_articles)
+        
+        # Only remember the feed validators once its articles are stored
+        self._save_feed_state(feed_url, etag, modified, article_ids)
+        
+        return article_ids
+
+    async def fetch_articles(self) -> List[Dict]:
+        """Fetch articles from all configured RSS feeds"""
+        all_article_ids = []
+        # One query up front instead of an existence check per entry
+        seen_ids = self.get_raw_article_ids()
+        
+        # Each feed's articles are processed as soon as that feed arrives, not after the slowest feed
+        results = await asyncio.gather(
+            *(self._fetch_one_feed(feed_url, seen_ids) for feed_url in self.feed_urls),
+            return_exceptions=True
+        )
+        
+        for feed_url, result in zip(self.feed_urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching from {feed_url}: {str(result)}")
                 continue
+            all_article_ids.extend(result)
                 
         # Process any unprocessed articles to ensure no missing articles
-        self.process_missing_articles()
+        await self.process_missing_articles()
         
-        return all_articles
+        return self._load_articles(list(dict.fromkeys(all_article_ids)))
 
     def get_stored_articles(self, processed: bool = True) -> List[Dict]:
-        """Retrieve stored articles"""
-        directory = self.processed_data_dir if processed else self.raw_data_dir
-        articles = []
-        
+        """Retrieve stored articles, either processed ones or those still awaiting processing"""
         try:
-            for filename in os.listdir(directory):
-                if filename.endswith('.json'):
-                    try:
-                        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
-                            articles.append(json.load(f))
-                    except Exception as e:
-                        logger.error(f"Error reading article file {filename}: {str(e)}")
+            rows = self._db.execute(
+                "SELECT payload FROM articles WHERE processed = ? ORDER BY date DESC",
+                (int(processed),)
+            )
+            return [orjson.loads(payload) for (payload,) in rows]
         except Exception as e:
-            logger.error(f"Error reading directory {directory}: {str(e)}")
-                    
-        return sorted(articles, key=lambda x: x.get('date', ''), reverse=True)
+            logger.error(f"Error reading stored articles: {str(e)}")
+            return []
 
     def get_raw_article_ids(self) -> Set[str]:
-        """Get the set of all raw article IDs from filenames"""
-        raw_ids = set()
+        """Get the set of all stored article IDs"""
         try:
-            for filename in os.listdir(self.raw_data_dir):
-                if filename.endswith('.json'):
-                    # Extract ID from filename (removing .json extension)
-                    article_id = filename[:-5]
-                    raw_ids.add(article_id)
+            return {article_id for (article_id,) in self._db.execute("SELECT id FROM articles")}
         except Exception as e:
             logger.error(f"Error getting raw article IDs: {str(e)}")
-        return raw_ids
+            return set()
     
     def get_processed_article_ids(self) -> Set[str]:
-        """Get the set of all processed article IDs from filenames"""
-        processed_ids = set()
+        """Get the set of processed article IDs"""
         try:
-            for filename in os.listdir(self.processed_data_dir):
-                if filename.endswith('.json'):
-                    # Extract ID from filename (removing .json extension)
-                    article_id = filename[:-5]
-                    processed_ids.add(article_id)
+            return {article_id for (article_id,) in self._db.execute("SELECT id FROM articles WHERE processed = 1")}
         except Exception as e:
             logger.error(f"Error getting processed article IDs: {str(e)}")
-        return processed_ids
+            return set()
 
-    def process_unprocessed_articles(self) -> int:
-        """Process any articles in the raw directory marked as unprocessed"""
+    async def _process_stored_articles(self, articles: List[Dict]) -> int:
+        """Process stored articles in batches, so a failure partway through keeps the batches already saved"""
         processed_count = 0
-        raw_articles = self.get_stored_articles(processed=False)
+        batch_size = settings.ARTICLES_BATCH_SIZE
+        for start in range(0, len(articles), batch_size):
+            processed_count += await self._process_article_batch(articles[start:start + batch_size])
+        return processed_count
+
+    async def _process_article_batch(self, articles: List[Dict]) -> int:
+        """Process a batch of stored articles concurrently and save the results in a single transaction"""
+        results = await asyncio.gather(
+            *(self._process_article(article) for article in articles),
+            return_exceptions=True
+        )
         
-        for article in raw_articles:
-            try:
-                if not article.get('processed', False):
-                    logger.info(f"Processing previously unprocessed article: {article.get('id', 'unknown')}")
-                    processed_article = self._process_article(article)
-                    self._save_processed_article(processed_article)
-                    processed_count += 1
-                    
-                    # Be nice to servers
-                    time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error during processing article {article.get('id', 'unknown')}: {str(e)}")
+        processed_count = 0
+        processed_articles = []
+        for article, result in zip(articles, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error during processing article {article.get('id', 'unknown')}: {str(result)}")
                 # Even if processing fails, save what we can to prevent endless retries
-                article['processing_error'] = str(e)
+                article['processing_error'] = str(result)
                 article['processed'] = True
                 article['processed_timestamp'] = datetime.utcnow().isoformat()
-                self._save_processed_article(article)
+                processed_articles.append(article)
+                continue
+            processed_articles.append(result)
+            processed_count += 1
         
+        self._save_articles(processed_articles)
         return processed_count
+
+    async def process_unprocessed_articles(self) -> int:
+        """Process any stored articles marked as unprocessed"""
+        raw_articles = [
+            article for article in self.get_stored_articles(processed=False)
+            if not article.get('processed', False)
+        ]
+        logger.info(f"Processing {len(raw_articles)} previously unprocessed articles")
+        
+        return await self._process_stored_articles(raw_articles)
         
-    def process_missing_articles(self) -> int:
+    async def process_missing_articles(self) -> int:
         """
-        Process any articles that exist in raw directory but not in processed directory
+        Process any stored articles that have no processed version yet
         This is a more thorough approach than just checking the 'processed' flag
         """
         raw_ids = self.get_raw_article_ids()
         processed_ids = self.get_processed_article_ids()
         
-        # Find IDs that are in raw but not in processed
-        missing_ids = raw_ids - processed_ids
-        processed_count = 0
-        
-        logger.info(f"Found {len(missing_ids)} articles missing from processed directory")
+        # Find IDs that are stored but not processed
+        missing_ids = list(raw_ids - processed_ids)
         
-        for article_id in missing_ids:
-            try:
-                # Load the raw article
-                with open(f"{self.raw_data_dir}/{article_id}.json", 'r', encoding='utf-8') as f:
-                    article = json.load(f)
-                
-                logger.info(f"Processing missing article: {article_id}")
-                processed_article = self._process_article(article)
-                self._save_processed_article(processed_article)
-                processed_count += 1
-                
-                # Be nice to servers
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error processing missing article {article_id}: {str(e)}")
-                # Create a minimal processed version to prevent endless retries
-                try:
-                    with open(f"{self.raw_data_dir}/{article_id}.json", 'r', encoding='utf-8') as f:
-                        article = json.load(f)
-                    
-                    article['processed'] = True
-                    article['processed_timestamp'] = datetime.utcnow().isoformat()
-                    article['processing_error'] = str(e)
-                    self._save_processed_article(article)
-                except Exception as inner_e:
-                    logger.error(f"Failed to create minimal processed article for {article_id}: {str(inner_e)}")
+        logger.info(f"Found {len(missing_ids)} articles missing a processed version")
         
+        # Load, process and save the raw articles one batch at a time
+        processed_count = 0
+        batch_size = settings.ARTICLES_BATCH_SIZE
+        for start in range(0, len(missing_ids), batch_size):
+            articles = self._load_articles(missing_ids[start:start + batch_size])
+            processed_count += await self._process_article_batch(articles)
         return processed_count
     
-    def sync_raw_processed(self):
+    async def sync_raw_processed(self):
         """
         Synchronize raw and processed articles to ensure all raw articles have processed versions
         Returns a tuple of (processed_count, error_count)
         """
-        processed_count = self.process_missing_articles()
-        unprocessed_count = self.process_unprocessed_articles()
+        processed_count = await self.process_missing_articles()
+        unprocessed_count = await self.process_unprocessed_articles()
         
         total_processed = processed_count + unprocessed_count
         logger.info(f"Synchronized raw and processed articles. Processed {total_processed} articles.")
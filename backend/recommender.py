@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Dict
 from vector_store import VectorStore
 from embeddings import EmbeddingGenerator
@@ -19,21 +20,46 @@ class Recommender:
         Returns:
             List of similar articles
         """
+        return self.get_similar_articles_batch([article_id], articles, k=k)[article_id]
+    
+    def get_similar_articles_batch(self, article_ids: List[str], articles: List[Dict], k: int = 5) -> Dict[str, List[Dict]]:
+        """
+        Find articles similar to each of the given article_ids with a single vector search
+        
+        Args:
+            article_ids: IDs of the articles to find similar articles for
+            articles: List of all articles to search through
+            k: Number of similar articles to return per article
+            
+        Returns:
+            Dictionary mapping each article ID to its list of similar articles
+        """
         # Create a dictionary mapping article IDs to articles
         articles_dict = {article['id']: article for article in articles}
+        similar = {article_id: [] for article_id in article_ids}
         
-        # Find the query article
-        query_article = articles_dict.get(article_id)
-        if not query_article:
-            return []
+        # Find the query articles
+        query_articles = [articles_dict[aid] for aid in similar if aid in articles_dict]
+        if not query_articles:
+            return similar
         
-        # Generate embedding for the query article
-        query_embedding = self.embedding_generator.get_article_embeddings([query_article])[article_id]
+        # Reuse the embeddings already in the vector store, only embedding articles it doesn't have
+        query_ids = [article['id'] for article in query_articles]
+        stored = [self.vector_store.get_embedding(aid) for aid in query_ids]
+        missing = [i for i, embedding in enumerate(stored) if embedding is None]
+        if missing:
+            _, new_embeddings = self.embedding_generator.get_article_embeddings([query_articles[i] for i in missing])
+            for i, embedding in zip(missing, new_embeddings):
+                stored[i] = embedding
+        query_embeddings = np.vstack(stored)
         
-        # Find similar article IDs from the vector store
-        similar_article_ids = self.vector_store.search_similar(query_embedding, k=k+1)  # +1 to account for the query article
+        # Search all queries in one batch, +1 to account for each query article
+        similar_article_ids = self.vector_store.search_similar_batch(query_embeddings, k=k+1)
         
-        # Get the full article data for similar articles, excluding the query article
-        similar_articles = [articles_dict[aid] for aid in similar_article_ids if aid != article_id]
+        # Get the full article data for similar articles, excluding each query article
+        for query_id, result_ids in zip(query_ids, similar_article_ids):
+            similar[query_id] = [
+                articles_dict[aid] for aid in result_ids if aid != query_id and aid in articles_dict
+            ][:k]
         
-        return similar_articles[:k]  # Limit to k results
\ No newline at end of file
+        return similar
\ No newline at end of file
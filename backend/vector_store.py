@@ -1,33 +1,118 @@
 import faiss
+import orjson
+import os
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Optional
 from config import settings
 
 class VectorStore:
     def __init__(self):
         self.dimension = settings.VECTOR_DIMENSION
-        self.index = faiss.IndexFlatL2(self.dimension)
+        self.index_path = settings.VECTOR_INDEX_PATH
+        self.ids_path = f"{os.path.splitext(self.index_path)[0]}_ids.json"
+        self.index = self._create_index(0)
         self.article_ids = []
-        
-    def add_articles(self, article_embeddings: Dict[str, List[float]]):
-        """Add article embeddings to the vector store"""
-        embeddings = []
-        for article_id, embedding in article_embeddings.items():
-            embeddings.append(embedding)
-            self.article_ids.append(article_id)
-            
-        embeddings_array = np.array(embeddings).astype('float32')
-        self.index.add(embeddings_array)
-    
-    def search_similar(self, query_embedding: List[float], k: int = 5) -> List[str]:
+        self._id_to_row = {}
+        self._load()
+
+    def _create_index(self, n_vectors: int):
+        """Create an empty index, switching from brute force to HNSW for large collections"""
+        # Vectors are L2-normalized, so inner product ranks by cosine similarity
+        if n_vectors > settings.VECTOR_HNSW_THRESHOLD:
+            base_index = faiss.IndexHNSWFlat(self.dimension, settings.VECTOR_HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            base_index.hnsw.efConstruction = settings.VECTOR_HNSW_EF_CONSTRUCTION
+            base_index.hnsw.efSearch = settings.VECTOR_HNSW_EF_SEARCH
+        else:
+            base_index = faiss.IndexFlatIP(self.dimension)
+        # Vectors are added with their row in article_ids as ID, so they can be reconstructed by row
+        return faiss.IndexIDMap2(base_index)
+
+    def _load(self):
+        """Load a previously persisted index to avoid rebuilding it on restart"""
+        if not (os.path.exists(self.index_path) and os.path.exists(self.ids_path)):
+            return
+        try:
+            index = faiss.read_index(self.index_path)
+            if index.metric_type != faiss.METRIC_INNER_PRODUCT:
+                # Indexes from earlier versions used L2 distance on unnormalized vectors
+                print("Discarding persisted vector index built with a different metric")
+                return
+            # efSearch is a query-time setting, so apply the configured value to loaded HNSW indexes
+            base_index = faiss.downcast_index(index.index)
+            if isinstance(base_index, faiss.IndexHNSW):
+                base_index.hnsw.efSearch = settings.VECTOR_HNSW_EF_SEARCH
+            self.index = index
+            with open(self.ids_path, 'rb') as f:
+                self.article_ids = orjson.loads(f.read())
+            self._id_to_row = {article_id: row for row, article_id in enumerate(self.article_ids)}
+        except Exception as e:
+            print(f"Error loading vector index: {str(e)}")
+            self.clear()
+
+    def _save(self):
+        """Persist the index and its article IDs to disk"""
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        faiss.write_index(self.index, self.index_path)
+        with open(self.ids_path, 'wb') as f:
+            f.write(orjson.dumps(self.article_ids))
+
+    def add_articles(self, article_ids: List[str], embeddings: np.ndarray):
+        """Add article embeddings to the vector store, one row per article ID"""
+        new_ids = list(article_ids)
+        if not new_ids:
+            return
+
+        # Single float32 copy that is normalized in place and handed to FAISS as-is
+        embeddings_array = np.array(embeddings, dtype='float32', order='C')
+        faiss.normalize_L2(embeddings_array)
+        start = len(self.article_ids)
+        total = start + len(new_ids)
+
+        if start <= settings.VECTOR_HNSW_THRESHOLD < total:
+            # Crossing the threshold: rebuild the existing vectors into an HNSW index
+            previous_index = self.index
+            self.index = self._create_index(total)
+            if start:
+                self.index.add_with_ids(previous_index.index.reconstruct_n(0, start), np.arange(start, dtype='int64'))
+        self.index.add_with_ids(embeddings_array, np.arange(start, total, dtype='int64'))
+
+        for row, article_id in enumerate(new_ids, start):
+            self._id_to_row[article_id] = row
+        self.article_ids.extend(new_ids)
+        self._save()
+
+    def row_of(self, article_id: str) -> Optional[int]:
+        """Return the index row (and FAISS ID) of an article, or None if it isn't indexed"""
+        return self._id_to_row.get(article_id)
+
+    def reconstruct(self, article_id: str) -> np.ndarray:
+        """Return the stored (normalized) embedding of an indexed article"""
+        return self.index.reconstruct(self._id_to_row[article_id])
+
+    def get_embedding(self, article_id: str) -> Optional[np.ndarray]:
+        """Return the stored (normalized) embedding of an article, or None if it isn't indexed"""
+        if article_id not in self._id_to_row:
+            return None
+        return self.reconstruct(article_id)
+
+    def search_similar(self, query_embedding: np.ndarray, k: int = 5) -> List[str]:
         """Search for similar articles using a query embedding"""
-        query_array = np.array([query_embedding]).astype('float32')
+        return self.search_similar_batch(np.asarray(query_embedding).reshape(1, -1), k=k)[0]
+
+    def search_similar_batch(self, query_embeddings: np.ndarray, k: int = 5) -> List[List[str]]:
+        """Search for similar articles for several query embeddings with a single index search"""
+        query_array = np.array(query_embeddings, dtype='float32', order='C')
+        faiss.normalize_L2(query_array)
         distances, indices = self.index.search(query_array, k)
-        
-        # Return the article IDs of the similar articles
-        return [self.article_ids[idx] for idx in indices[0]]
-    
+
+        # Return the article IDs of the similar articles per query, skipping empty result slots
+        return [[self.article_ids[idx] for idx in row if idx != -1] for row in indices]
+
     def clear(self):
-        """Clear the vector store"""
-        self.index = faiss.IndexFlatL2(self.dimension)
-        self.article_ids = []
\ No newline at end of file
+        """Clear the vector store, including its persisted copy"""
+        self.index = self._create_index(0)
+        self.article_ids = []
+        self._id_to_row = {}
+        for path in (self.index_path, self.ids_path):
+            if os.path.exists(path):
+                os.remove(path)
\ No newline at end of file